@@ -1,14 +1,121 @@
-def requiere_positivos(funcion):
-    def wrapper(*args):
-        try:
-            for arg in args:
-                if arg < 0:
-                    raise ValueError("Todos los valores ingresados deben ser positivos")
-            return funcion(*args)
-        except ValueError as e:
-            return f"Error: {e}"
-    return wrapper
-    
+"""
+Decoradores de validación que aceptan escalares, arreglos de NumPy y Series de pandas.
+Cada restricción devuelve las violaciones del valor (un booleano o una máscara); por cada
+argumento se combinan las máscaras y se hace una sola reducción vectorizada (any).
+"""
+
+import inspect
+import math
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+VALIDACIONES_ACTIVAS = True
+
+
+def _es_arreglo(valor):
+    return hasattr(valor, "__array__") and not isinstance(valor, (int, float))
+
+def positivo(valor):
+    return valor < 0
+positivo.descripcion = "positivos"
+
+def finito(valor):
+    if _es_arreglo(valor):
+        return ~np.isfinite(valor)
+    return not math.isfinite(valor)
+finito.descripcion = "finitos"
+
+def en_rango(minimo, maximo):
+    def fuera_de_rango(valor):
+        return (valor < minimo) | (valor > maximo)
+    fuera_de_rango.descripcion = f"de {minimo} a {maximo}"
+    return fuera_de_rango
+
+def _hay_violaciones(valor, restricciones):
+    violaciones = restricciones[0](valor)
+    for restriccion in restricciones[1:]:
+        violaciones = violaciones | restriccion(valor)
+    if _es_arreglo(violaciones):
+        # np.any reduce todos los ejes: un DataFrame (2-D) da un solo booleano, no una Serie
+        return bool(np.any(np.asarray(violaciones)))
+    return bool(violaciones)
+
+def _como_tupla(restricciones):
+    return tuple(restricciones) if isinstance(restricciones, (list, tuple)) else (restricciones,)
+
+def _describir(restricciones):
+    return " y ".join(r.descripcion for r in restricciones)
+
+
+@contextmanager
+def sin_validaciones():
+    """Desactiva temporalmente todas las validaciones (para rutas críticas)."""
+    global VALIDACIONES_ACTIVAS
+    anterior = VALIDACIONES_ACTIVAS
+    VALIDACIONES_ACTIVAS = False
+    try:
+        yield
+    finally:
+        VALIDACIONES_ACTIVAS = anterior
+
+
+def valida(*restricciones, **por_argumento):
+    """
+    valida(positivo, finito) aplica las restricciones a todos los argumentos (posicionales y kwargs).
+    valida(precio=positivo, porcentaje=[finito, en_rango(0, 100)]) las aplica por nombre de argumento.
+    """
+    por_argumento = {nombre: _como_tupla(r) for nombre, r in por_argumento.items()}
+    if not restricciones and not por_argumento:
+        raise ValueError("valida() necesita al menos una restricción")
+    vacios = [nombre for nombre, reglas in por_argumento.items() if not reglas]
+    if vacios:
+        raise ValueError(f"Lista de restricciones vacía para: {', '.join(vacios)}")
+
+    def decorador(funcion):
+        firma = inspect.signature(funcion) if por_argumento else None
+
+        @wraps(funcion)
+        def wrapper(*args, **kwargs):
+            if not VALIDACIONES_ACTIVAS:
+                return funcion(*args, **kwargs)
+            try:
+                if restricciones:
+                    for arg in (*args, *kwargs.values()):
+                        if _hay_violaciones(arg, restricciones):
+                            raise ValueError(f"Todos los valores ingresados deben ser {_describir(restricciones)}")
+                if por_argumento:
+                    argumentos = firma.bind(*args, **kwargs).arguments
+                    for nombre, reglas in por_argumento.items():
+                        if nombre in argumentos and _hay_violaciones(argumentos[nombre], reglas):
+                            raise ValueError(f"Los valores de '{nombre}' deben ser {_describir(reglas)}")
+                return funcion(*args, **kwargs)
+            except ValueError as e:
+                return f"Error: {e}"
+
+        wrapper.sin_validar = funcion
+        return wrapper
+    return decorador
+
+
+requiere_positivos = valida(positivo)
+
+
+def medir_sobrecosto(funcion, *args, repeticiones=100_000, **kwargs):
+    """Devuelve los nanosegundos por llamada que añade la validación a una función decorada."""
+    def tiempo_por_llamada(f):
+        inicio = time.perf_counter_ns()
+        for _ in range(repeticiones):
+            f(*args, **kwargs)
+        return (time.perf_counter_ns() - inicio) / repeticiones
+    return tiempo_por_llamada(funcion) - tiempo_por_llamada(funcion.sin_validar)
+
+
 @requiere_positivos
 def cacular_descuento(precio, porcentaje):
     return precio * (1 - porcentaje / 100)
@@ -17,7 +124,25 @@ def cacular_descuento(precio, porcentaje):
 def escala(valor, factor):
     return valor * factor
 
-print(cacular_descuento(100, 10))
-print(cacular_descuento(-50, 20))
-print(escala(5, 3))
-print(escala(10, -2))
\ No newline at end of file
+@valida(precio=[positivo, finito], porcentaje=en_rango(0, 100))
+def descuento_validado(precio, porcentaje):
+    return precio * (1 - porcentaje / 100)
+
+if __name__ == "__main__":
+    print(cacular_descuento(100, 10))
+    print(cacular_descuento(-50, 20))
+    print(escala(5, 3))
+    print(escala(10, -2))
+    print(escala(valor=10, factor=-2))
+    print(descuento_validado(100, porcentaje=150))
+    print(f"Sobrecosto por llamada (escalar): {medir_sobrecosto(cacular_descuento, 100, 10):.0f} ns")
+
+    if np is not None:
+        precios = np.array([100.0, 80.0, 45.5])
+        print(cacular_descuento(precios, 10))
+        print(escala(precios, -1))
+        print(descuento_validado(np.array([100.0, np.inf]), 10))
+        with sin_validaciones():
+            print(escala(precios, -1))
+        print(f"Sobrecosto por llamada (arreglo 1e6): "
+              f"{medir_sobrecosto(cacular_descuento, np.ones(1_000_000), 10, repeticiones=100) / 1e3:.0f} µs")
@@ -0,0 +1,128 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import A2_funciones_internas
+import C1_decoradores
+from A2_funciones_internas import aplicar_reglas, compilar_reglas, crear_descuento
+from C1_decoradores import (
+    cacular_descuento,
+    descuento_validado,
+    en_rango,
+    escala,
+    finito,
+    sin_validaciones,
+    valida,
+)
+
+ERROR_POSITIVOS = "Error: Todos los valores ingresados deben ser positivos"
+
+
+def test_requiere_positivos_escalares_y_kwargs():
+    assert cacular_descuento(100, 10) == 90.0
+    assert escala(5, 3) == 15
+    assert cacular_descuento(-50, 20) == ERROR_POSITIVOS
+    assert escala(valor=10, factor=-2) == ERROR_POSITIVOS
+    assert escala(10, factor=-2) == ERROR_POSITIVOS
+
+def test_requiere_positivos_arreglos_y_series():
+    precios = np.array([100.0, 80.0])
+    np.testing.assert_allclose(cacular_descuento(precios, 10), [90.0, 72.0])
+    assert escala(np.array([1.0, -1.0]), 2) == ERROR_POSITIVOS
+    columna = pd.Series([100.0, 50.0])
+    assert cacular_descuento(columna, 10).tolist() == [90.0, 45.0]
+    assert escala(pd.Series([1.0, -0.5]), 2) == ERROR_POSITIVOS
+
+def test_requiere_positivos_dataframes_y_matrices():
+    assert escala(pd.DataFrame({"a": [1, -1]}), 2) == ERROR_POSITIVOS
+    assert escala(np.array([[1.0, 2.0], [3.0, -4.0]]), 2) == ERROR_POSITIVOS
+    assert escala(pd.DataFrame({"a": [1, 2], "b": [3, 4]}), 2).equals(pd.DataFrame({"a": [2, 4], "b": [6, 8]}))
+
+def test_restricciones_por_argumento():
+    assert descuento_validado(100, porcentaje=10) == 90.0
+    assert descuento_validado(100, porcentaje=150) == "Error: Los valores de 'porcentaje' deben ser de 0 a 100"
+    assert descuento_validado(np.array([100.0, np.inf]), 10) == (
+        "Error: Los valores de 'precio' deben ser positivos y finitos"
+    )
+    assert descuento_validado(pd.Series([10.0, 20.0]), pd.Series([0, 101])).startswith("Error")
+
+def test_en_rango_y_finito():
+    @valida(finito, en_rango(0, 5))
+    def suma(a, b=1):
+        return a + b
+
+    assert suma(1, b=2) == 3
+    assert suma(0, 5) == 5
+    assert suma(6) == "Error: Todos los valores ingresados deben ser finitos y de 0 a 5"
+    assert suma(1, b=float("nan")).startswith("Error")
+    assert suma(np.array([0.0, 5.0, 5.1])).startswith("Error")
+
+def test_valida_rechaza_restricciones_vacias():
+    with pytest.raises(ValueError):
+        valida(precio=[])
+    with pytest.raises(ValueError):
+        valida()
+
+def test_sin_validaciones_y_sin_validar():
+    with sin_validaciones():
+        assert escala(10, -2) == -20
+        assert C1_decoradores.VALIDACIONES_ACTIVAS is False
+    assert C1_decoradores.VALIDACIONES_ACTIVAS is True
+    assert escala(10, -2) == ERROR_POSITIVOS
+    assert escala.sin_validar(10, -2) == -20
+
+
+def test_aplicar_reglas_tabla_densa_y_claves_fuera_de_rango():
+    reglas = {1: crear_descuento(10), 3: 50, 7: 0}
+    assert compilar_reglas(reglas)[2] is not None
+    precios = aplicar_reglas([100] * 6, [0, 1, 3, 7, 9, -5], reglas)
+    np.testing.assert_allclose(precios, [100, 90, 50, 100, 100, 100])
+    claves_uint8 = np.array([1, 3, 2], dtype=np.uint8)
+    np.testing.assert_allclose(aplicar_reglas([100] * 3, claves_uint8, reglas), [90, 50, 100])
+
+def test_aplicar_reglas_claves_dispersas_y_texto():
+    dispersas = {1: 10, 1_000: 20}
+    assert compilar_reglas(dispersas)[2] is None
+    np.testing.assert_allclose(aplicar_reglas([100] * 3, [1, 1_000, 5], dispersas), [90, 80, 100])
+    texto = {"A": crear_descuento(10), "B": 25}
+    np.testing.assert_allclose(aplicar_reglas([100, 80, 40], ["B", "A", "Z"], texto), [75, 72, 40])
+
+def test_aplicar_reglas_un_solo_articulo():
+    assert aplicar_reglas(100, 1, {1: crear_descuento(10), 3: 25}) == pytest.approx(90)
+    assert aplicar_reglas(100, "A", {"A": 20}) == pytest.approx(80)
+
+def test_aplicar_reglas_sin_reglas():
+    precios = np.array([10.0, 20.0])
+    resultado = aplicar_reglas(precios, [1, 2], {})
+    np.testing.assert_allclose(resultado, precios)
+    assert resultado is not precios
+
+def test_reglas_con_claves_mixtas_se_rechazan():
+    with pytest.raises(ValueError):
+        aplicar_reglas([100], [1], {1: 10, "A": 20})
+
+def test_reglas_no_proporcionales_se_rechazan():
+    with pytest.raises(ValueError):
+        aplicar_reglas([100, 50], [1, 2], {1: lambda p: p - 5})
+    proporcional = {1: lambda p: p * 0.5, 2: crear_descuento(20)}
+    np.testing.assert_allclose(aplicar_reglas([100, 50], [1, 2], proporcional), [50, 40])
+
+def test_importar_no_imprime():
+    importar = subprocess.run(
+        [sys.executable, "-c", "import A2_funciones_internas"],
+        cwd=Path(__file__).parent, capture_output=True, text=True, check=True,
+    )
+    assert importar.stdout == ""
+
+def test_compilar_reglas_reutiliza_la_cache():
+    A2_funciones_internas._compilar.cache_clear()
+    reglas = {1: 10, 2: 20}
+    primera = compilar_reglas(reglas)
+    assert compilar_reglas(reglas) is primera
+    info = A2_funciones_internas._compilar.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+    assert not primera[1].flags.writeable
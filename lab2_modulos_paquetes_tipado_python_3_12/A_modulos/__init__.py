@@ -1,5 +1,5 @@
 from .operaciones_aritmeticas import suma
-from .calculadora import ejecutar_operaciones
+from .calculadora import ejecutar_operaciones, calcular_operaciones_lote
 from .textos import obtener_texto_suma
 
-__all__ = ['suma', 'obtener_texto_suma', 'ejecutar_operaciones']
\ No newline at end of file
+__all__ = ['suma', 'obtener_texto_suma', 'ejecutar_operaciones', 'calcular_operaciones_lote']
\ No newline at end of file
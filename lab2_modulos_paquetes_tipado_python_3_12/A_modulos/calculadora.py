@@ -1,40 +1,63 @@
+import numpy as np
+
 from . import operaciones_aritmeticas as op
 
 
 """
 Este módulo utiliza funciones aritméticas importadas desde 'operaciones_aritmeticas' para ejecutar operaciones básicas (suma, resta, multiplicación y división) entre dos números.
+También ofrece una versión por lotes que opera sobre dos arreglos o columnas completas y devuelve arreglos enmascarados en lugar de imprimir errores.
 """
 
+def calcular_operaciones(num1, num2):
+    op.validate_numbers(num1, num2)
+    return {
+        "suma": op.suma(num1, num2),
+        "resta": op.resta(num1, num2),
+        "multiplicacion": op.multiplicacion(num1, num2),
+        "division": None if num2 == 0 else op.division(num1, num2),
+    }
+
 def ejecutar_operaciones(num1, num2):
     try:
-        op.validate_numbers(num1, num2)
-        print(f"El resultado de la suma es: {op.suma(num1, num2)}")
-        print(f"El resultado de la resta es: {op.resta(num1, num2)}")
-        print(f"El resultado de la multiplicación es: {op.multiplicacion(num1, num2)}")
-        if num2 == 0:
+        resultados = calcular_operaciones(num1, num2)
+        print(f"El resultado de la suma es: {resultados['suma']}")
+        print(f"El resultado de la resta es: {resultados['resta']}")
+        print(f"El resultado de la multiplicación es: {resultados['multiplicacion']}")
+        if resultados["division"] is None:
             print("Error: División por cero no está permitida.")
         else:
-            print(f"El resultado de la división es: {op.division(num1, num2)}")
+            print(f"El resultado de la división es: {resultados['division']}")
     except ValueError as e:
         print(f"Error: {e}")
 
 
-""""
-Casos de prueba:
-1. ejecutar_operaciones(10, 5)
-    - Realiza suma, resta, multiplicación y división entre 10 y 5.
-    - Espera resultados numéricos válidos para todas las operaciones.
-"""
-ejecutar_operaciones(10, 5)
-"""
-2. ejecutar_operaciones(10, 0)
-    - Realiza suma, resta y multiplicación entre 10 y 0.
-    - Para la división, detecta el caso de división por cero y muestra un mensaje de error correspondiente.
-"""
-ejecutar_operaciones(10, 0)
-"""
-3. ejecutar_operaciones(10, 'a')
-    - Intenta realizar operaciones entre un número y un valor no numérico ('a').
-    - Espera que la función 'validate_numbers' lance una excepción ValueError, la cual es capturada y mostrada como mensaje de error.
-"""
-ejecutar_operaciones(10, 'a')
\ No newline at end of file
+def _a_numerico(valores):
+    arreglo = np.asarray(valores)
+    if arreglo.dtype.kind in "biuf":
+        return arreglo.astype(float), np.zeros(arreglo.shape, dtype=bool)
+    # Entradas mixtas o de tipo object: mismo criterio que validate_numbers, elemento por elemento.
+    arreglo = np.asarray(valores, dtype=object)
+    invalidos = np.fromiter(
+        (not isinstance(x, (int, float)) for x in arreglo.flat), dtype=bool, count=arreglo.size
+    ).reshape(arreglo.shape)
+    return np.where(invalidos, 0, arreglo).astype(float), invalidos
+
+def calcular_operaciones_lote(num1, num2):
+    """
+    Aplica las cuatro operaciones a dos arreglos o columnas (se admite broadcasting) y devuelve
+    un diccionario de np.ma.MaskedArray. Las parejas con valores no numéricos quedan enmascaradas
+    en todos los resultados; las divisiones por cero, solo en 'division'.
+    """
+    a, invalidos_a = _a_numerico(num1)
+    b, invalidos_b = _a_numerico(num2)
+    invalidos = invalidos_a | invalidos_b
+    divisor_cero = b == 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cociente = op.division(a, np.where(divisor_cero, 1, b))
+    return {
+        "suma": np.ma.masked_array(op.suma(a, b), mask=invalidos),
+        "resta": np.ma.masked_array(op.resta(a, b), mask=invalidos),
+        "multiplicacion": np.ma.masked_array(op.multiplicacion(a, b), mask=invalidos),
+        "division": np.ma.masked_array(cociente, mask=invalidos | divisor_cero),
+    }
+
@@ -0,0 +1,34 @@
+"""
+Compara la ruta por pareja (calcular_operaciones en un bucle) con calcular_operaciones_lote.
+Ejecutar desde esta carpeta: python benchmark_calculadora.py
+"""
+
+import time
+
+import numpy as np
+
+from A_modulos import calcular_operaciones_lote
+from A_modulos.calculadora import calcular_operaciones
+
+N = 1_000_000
+
+
+def medir(nombre, funcion):
+    inicio = time.perf_counter()
+    resultado = funcion()
+    duracion = time.perf_counter() - inicio
+    print(f"{nombre:<30} {duracion:8.3f} s  ({N / duracion:14,.0f} parejas/s)")
+    return resultado
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    num1 = rng.integers(-100, 100, N)
+    num2 = rng.integers(-10, 10, N)
+
+    por_pareja = medir("calcular_operaciones (bucle)",
+                       lambda: [calcular_operaciones(a, b) for a, b in zip(num1.tolist(), num2.tolist())])
+    lote = medir("calcular_operaciones_lote", lambda: calcular_operaciones_lote(num1, num2))
+
+    divisiones = np.array([r["division"] if r["division"] is not None else np.nan for r in por_pareja])
+    assert np.allclose(lote["division"].filled(np.nan), divisiones, equal_nan=True)
@@ -0,0 +1,28 @@
+from A_modulos import ejecutar_operaciones, calcular_operaciones_lote
+
+
+"""
+Casos de prueba de A_modulos.calculadora (ejecutar desde esta carpeta: python demo_calculadora.py):
+1. ejecutar_operaciones(10, 5)
+    - Realiza suma, resta, multiplicación y división entre 10 y 5.
+    - Espera resultados numéricos válidos para todas las operaciones.
+"""
+ejecutar_operaciones(10, 5)
+"""
+2. ejecutar_operaciones(10, 0)
+    - Realiza suma, resta y multiplicación entre 10 y 0.
+    - Para la división, detecta el caso de división por cero y muestra un mensaje de error correspondiente.
+"""
+ejecutar_operaciones(10, 0)
+"""
+3. ejecutar_operaciones(10, 'a')
+    - Intenta realizar operaciones entre un número y un valor no numérico ('a').
+    - Espera que la función 'validate_numbers' lance una excepción ValueError, la cual es capturada y mostrada como mensaje de error.
+"""
+ejecutar_operaciones(10, 'a')
+"""
+4. calcular_operaciones_lote([10, 10, 10], [5, 0, 'a'])
+    - Los tres casos anteriores en una sola llamada: la división por cero y el valor no numérico quedan enmascarados.
+"""
+for nombre, resultado in calcular_operaciones_lote([10, 10, 10], [5, 0, 'a']).items():
+    print(f"{nombre}: {resultado}")
@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from A_modulos import calcular_operaciones_lote
+from A_modulos.calculadora import calcular_operaciones
+
+
+def test_calcular_operaciones():
+    assert calcular_operaciones(10, 5) == {"suma": 15, "resta": 5, "multiplicacion": 50, "division": 2.0}
+    assert calcular_operaciones(10, 0)["division"] is None
+    with pytest.raises(ValueError):
+        calcular_operaciones(10, 'a')
+
+def test_lote_resultados_validos():
+    resultados = calcular_operaciones_lote([10, 4], [5, 2])
+    assert resultados["suma"].tolist() == [15, 6]
+    assert resultados["resta"].tolist() == [5, 2]
+    assert resultados["multiplicacion"].tolist() == [50, 8]
+    assert resultados["division"].tolist() == [2, 2]
+    assert not np.ma.getmaskarray(resultados["division"]).any()
+
+def test_lote_enmascara_division_por_cero_y_no_numericos():
+    resultados = calcular_operaciones_lote([10, 10, 'x'], [5, 0, 2])
+    assert np.ma.getmaskarray(resultados["suma"]).tolist() == [False, False, True]
+    assert np.ma.getmaskarray(resultados["multiplicacion"]).tolist() == [False, False, True]
+    assert np.ma.getmaskarray(resultados["division"]).tolist() == [False, True, True]
+    assert resultados["resta"][1] == 10
+
+def test_lote_broadcasting():
+    resultados = calcular_operaciones_lote(10, [1, 2, 0])
+    assert resultados["suma"].tolist() == [11, 12, 10]
+    assert resultados["division"].tolist() == [10, 5, None]
+
+def test_lote_series_de_pandas():
+    num1 = pd.Series([1.0, 2.0, 3.0])
+    num2 = pd.Series([0, 2, 'x'], dtype=object)
+    resultados = calcular_operaciones_lote(num1, num2)
+    assert resultados["suma"].tolist() == [1, 4, None]
+    assert resultados["division"].tolist() == [None, 1, None]
@@ -0,0 +1,52 @@
+"""
+Compara las funciones originales (texto completo en memoria) con la API por bloques
+sobre un corpus grande. Ejecutar desde esta carpeta: python benchmark_textos.py
+"""
+
+import tempfile
+import time
+from pathlib import Path
+
+from modulo_simple_probando_pytest import (
+    contar_palabras,
+    es_palindromo,
+    es_palindromo_dos_punteros,
+    contar_palabras_archivo,
+    contar_palabras_lote,
+)
+
+REPETICIONES = 2_000_000
+FRASE = "Anita lava la tina en el rio\n"
+
+
+def medir(nombre, funcion, *args):
+    inicio = time.perf_counter()
+    resultado = funcion(*args)
+    duracion = time.perf_counter() - inicio
+    print(f"{nombre:<45} {duracion:8.3f} s")
+    return resultado
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta = Path(carpeta) / "corpus.txt"
+        ruta.write_text(FRASE * REPETICIONES)
+        print(f"Corpus: {ruta.stat().st_size / 1e6:.1f} MB")
+
+        a = medir("contar_palabras(read_text())", lambda: contar_palabras(ruta.read_text()))
+        b = medir("contar_palabras_archivo (mmap)", contar_palabras_archivo, ruta)
+        assert a == b
+
+    palindromo = "Anita lava la tina " * 200_000
+    palindromo += palindromo[::-1]
+    a = medir("es_palindromo", es_palindromo, palindromo)
+    b = medir("es_palindromo_dos_punteros", es_palindromo_dos_punteros, palindromo)
+    assert a == b
+    no_palindromo = "x" + palindromo
+    medir("es_palindromo (no palíndromo)", es_palindromo, no_palindromo)
+    medir("es_palindromo_dos_punteros (no palíndromo)", es_palindromo_dos_punteros, no_palindromo)
+
+    documentos = [FRASE * 5_000] * 2_000
+    a = medir("contar_palabras en bucle", lambda: [contar_palabras(d) for d in documentos])
+    b = medir("contar_palabras_lote (pool)", contar_palabras_lote, documentos)
+    assert a == b
@@ -1,3 +1,18 @@
+import codecs
+import mmap
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+TAMANO_BLOQUE = 1 << 20
+
+# Cada byte ASCII se traduce a b' ' si es espacio para str.split() (incluye \x1c-\x1f)
+# o a b'x' si no lo es; así un inicio de palabra es la secuencia b' x'.
+_TABLA_PALABRAS_ASCII = bytes(
+    ord(" ") if chr(b).isspace() else ord("x") for b in range(256)
+)
+_PALABRA = re.compile(r"\S+")
+
+
 def contar_palabras(texto: str) -> int:
     if not isinstance(texto, str):
         raise TypeError("El argumento debe ser una cadena de texto.")
@@ -9,7 +24,111 @@ def es_palindromo(texto: str) -> bool:
     texto_limpio = ''.join(c.lower() for c in texto if c.isalnum())
     return texto_limpio == texto_limpio[::-1]
 
+def es_palindromo_dos_punteros(texto: str) -> bool:
+    """
+    Igual que es_palindromo pero sin copias: recorre la cadena desde ambos extremos.
+    Compara los caracteres ya pasados a minúsculas, porque lower() puede devolver más de
+    uno (por ejemplo "İ"). Es más lenta en palíndromos (el bucle es Python puro) y termina
+    en cuanto hay una diferencia, así que conviene para textos largos que casi nunca lo son.
+    """
+    if not isinstance(texto, str):
+        raise TypeError("El argumento debe ser una cadena de texto.")
+    adelante = (m for c in texto if c.isalnum() for m in c.lower())
+    atras = (m for c in reversed(texto) if c.isalnum() for m in reversed(c.lower()))
+    return all(a == b for a, b in zip(adelante, atras))
+
 def mayusculas(texto: str) -> str:
     if not isinstance(texto, str):
         raise TypeError("El argumento debe ser una cadena de texto.")
-    return texto.upper()
\ No newline at end of file
+    return texto.upper()
+
+
+def _contar_bloque_ascii(bloque: bytes, en_palabra: bool) -> tuple[int, bool]:
+    if not bloque:
+        return 0, en_palabra
+    traducido = bloque.translate(_TABLA_PALABRAS_ASCII)
+    total = traducido.count(b" x")
+    if traducido[0:1] == b"x" and not en_palabra:
+        total += 1
+    return total, traducido[-1:] == b"x"
+
+def _contar_bloque_texto(bloque: str, en_palabra: bool) -> tuple[int, bool]:
+    if not bloque:
+        return 0, en_palabra
+    if bloque.isascii():
+        return _contar_bloque_ascii(bloque.encode("ascii"), en_palabra)
+    total = sum(1 for _ in _PALABRA.finditer(bloque))
+    if en_palabra and not bloque[0].isspace():
+        total -= 1
+    return total, not bloque[-1].isspace()
+
+def _contador_bytes(codificacion: str):
+    # Los bytes se cuentan con las mismas reglas que str.split(): los bloques ASCII se
+    # cuentan directo y el resto se decodifica (el decodificador guarda los caracteres
+    # multibyte partidos entre bloques).
+    decodificador = codecs.getincrementaldecoder(codificacion)()
+
+    def contar(bloque, en_palabra):
+        bloque = bytes(bloque)
+        if bloque.isascii() and not decodificador.getstate()[0]:
+            return _contar_bloque_ascii(bloque, en_palabra)
+        return _contar_bloque_texto(decodificador.decode(bloque), en_palabra)
+
+    def finalizar(en_palabra):
+        # Un carácter multibyte incompleto al final falla igual que en bytes.decode
+        return _contar_bloque_texto(decodificador.decode(b"", final=True), en_palabra)
+
+    contar.finalizar = finalizar
+    return contar
+
+def contar_palabras_stream(fuente, tamano_bloque: int = TAMANO_BLOQUE, codificacion: str = "utf-8") -> int:
+    """
+    Cuenta palabras de una cadena, buffer (bytes, mmap) o archivo abierto por bloques.
+    El resultado coincide con contar_palabras: los bytes se interpretan como texto en
+    'codificacion', también para espacios Unicode y los separadores \x1c-\x1f.
+    """
+    if isinstance(fuente, str):
+        bloques = (fuente[i:i + tamano_bloque] for i in range(0, len(fuente), tamano_bloque))
+        contar = _contar_bloque_texto
+    elif isinstance(fuente, (bytes, bytearray, memoryview, mmap.mmap)):
+        vista = memoryview(fuente)
+        bloques = (vista[i:i + tamano_bloque] for i in range(0, len(vista), tamano_bloque))
+        contar = _contador_bytes(codificacion)
+    elif hasattr(fuente, "read"):
+        bloques = iter(lambda: fuente.read(tamano_bloque), fuente.read(0))
+        contar = _contar_bloque_texto if isinstance(fuente.read(0), str) else _contador_bytes(codificacion)
+    else:
+        raise TypeError("La fuente debe ser una cadena, un buffer de bytes o un archivo abierto.")
+
+    total, en_palabra = 0, False
+    for bloque in bloques:
+        parcial, en_palabra = contar(bloque, en_palabra)
+        total += parcial
+    if hasattr(contar, "finalizar"):
+        total += contar.finalizar(en_palabra)[0]
+    return total
+
+def contar_palabras_archivo(ruta, tamano_bloque: int = TAMANO_BLOQUE, codificacion: str = "utf-8") -> int:
+    """Cuenta palabras de un archivo mapeándolo en memoria, sin cargarlo completo."""
+    with open(ruta, "rb") as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+                return contar_palabras_stream(mapa, tamano_bloque, codificacion)
+        except ValueError:
+            # mmap no admite archivos vacíos
+            return 0
+
+
+def _procesar_lote(funcion, documentos, workers, chunksize):
+    if workers == 1:
+        return [funcion(doc) for doc in documentos]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(funcion, documentos, chunksize=chunksize))
+
+def contar_palabras_lote(documentos, workers: int | None = None, chunksize: int = 64) -> list[int]:
+    """Cuenta las palabras de cada documento repartiendo el trabajo en un pool de procesos."""
+    return _procesar_lote(contar_palabras_stream, documentos, workers, chunksize)
+
+def es_palindromo_lote(documentos, workers: int | None = None, chunksize: int = 64) -> list[bool]:
+    """Evalúa es_palindromo sobre cada documento repartiendo el trabajo en un pool de procesos."""
+    return _procesar_lote(es_palindromo, documentos, workers, chunksize)
@@ -1,5 +1,16 @@
+import io
+
 import pytest
-from modulo_simple_probando_pytest import contar_palabras, es_palindromo, mayusculas
+from modulo_simple_probando_pytest import (
+    contar_palabras,
+    es_palindromo,
+    es_palindromo_dos_punteros,
+    mayusculas,
+    contar_palabras_stream,
+    contar_palabras_archivo,
+    contar_palabras_lote,
+    es_palindromo_lote,
+)
 
 def test_contar_palabras():
     assert contar_palabras("Hola mundo") == 2
@@ -18,4 +29,51 @@ def test_mayusculas():
     assert mayusculas("hola") == "HOLA"
     assert mayusculas("") == "" 
     with pytest.raises(TypeError):
-        mayusculas(['hola'])
\ No newline at end of file
+        mayusculas(['hola'])
+
+def test_contar_palabras_stream():
+    texto = "Hola mundo\n  desde\tpytest "
+    assert contar_palabras_stream(texto) == 4
+    assert contar_palabras_stream(texto, tamano_bloque=3) == 4
+    assert contar_palabras_stream(texto.encode(), tamano_bloque=2) == 4
+    assert contar_palabras_stream(io.StringIO(texto), tamano_bloque=5) == 4
+    assert contar_palabras_stream(io.BytesIO(texto.encode()), tamano_bloque=1) == 4
+    assert contar_palabras_stream("") == 0
+    with pytest.raises(TypeError):
+        contar_palabras_stream(123)
+
+def test_stream_coincide_con_contar_palabras_en_unicode():
+    texto = "hola mundo\u3000adiós\x1cfin ñandú\u00a0pingüino"
+    esperado = contar_palabras(texto)
+    assert esperado == 6
+    for tamano_bloque in (1, 2, 3, 5, 64):
+        assert contar_palabras_stream(texto, tamano_bloque) == esperado
+        assert contar_palabras_stream(texto.encode(), tamano_bloque) == esperado
+        assert contar_palabras_stream(io.BytesIO(texto.encode()), tamano_bloque) == esperado
+
+def test_stream_falla_con_multibyte_incompleto_al_final():
+    for tamano_bloque in (1, 4, 64):
+        with pytest.raises(UnicodeDecodeError):
+            contar_palabras_stream(b"hola \xc3", tamano_bloque)
+
+def test_es_palindromo_dos_punteros():
+    for texto in ["Anita lava la tina", "Hola mundo", "", "a", ",.", "Ab,bA!", "İi", "iİ", "İ"]:
+        assert es_palindromo_dos_punteros(texto) is es_palindromo(texto)
+    with pytest.raises(TypeError):
+        es_palindromo_dos_punteros(None)
+
+def test_contar_palabras_archivo(tmp_path):
+    ruta = tmp_path / "corpus.txt"
+    ruta.write_text("uno dos\ntres " * 1000)
+    assert contar_palabras_archivo(ruta, tamano_bloque=7) == 3000
+    unicode = tmp_path / "unicode.txt"
+    unicode.write_text("uno\u3000dos\x1ctres ", encoding="utf-8")
+    assert contar_palabras_archivo(unicode, tamano_bloque=4) == 3
+    vacio = tmp_path / "vacio.txt"
+    vacio.write_text("")
+    assert contar_palabras_archivo(vacio) == 0
+
+def test_lotes():
+    documentos = ["Hola mundo", "", "Anita lava la tina"]
+    assert contar_palabras_lote(documentos, workers=2) == [2, 0, 4]
+    assert es_palindromo_lote(documentos, workers=1) == [False, True, True]
@@ -4,15 +4,46 @@ Implementa un flujo completo de ETL con Dagster para análisis epidemiológico
 """
 
 import io
-import pandas as pd
-import requests
+import time
 from datetime import datetime, timedelta
-from dagster import asset, AssetCheckResult, asset_check, AssetExecutionContext
+from dagster import asset, AssetCheckResult, asset_check, AssetExecutionContext, Config
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+# pandas y requests se importan dentro de cada asset para que cargar las definiciones
+# (webserver, comandos dg, run workers) no pague su costo de importación.
+# Dagster evalúa las anotaciones al definir los assets, por eso en ejecución DataFrame es Any.
+if TYPE_CHECKING:
+    from pandas import DataFrame
+else:
+    DataFrame = Any
 
 # Configuración global
 URL_DATOS_COVID = "https://catalog.ourworldindata.org/garden/covid/latest/compact/compact.csv"
 PAISES_ANALISIS = ["Ecuador", "Peru"]
+CLAVE_SKETCHES = "sketches_entrada"
+
+
+class ConfigLecturaDatos(Config):
+    """
+    Configuración de leer_datos. Con construir_sketches=True el CSV se lee por bloques y con
+    cada bloque se alimentan sketches combinables (Bloom, HyperLogLog y contadores), que se
+    guardan en leer_datos.attrs; los chequeos de entrada los usan en lugar de recorrer el
+    DataFrame y solo verifican de forma exacta lo que el sketch marca.
+    """
+    construir_sketches: bool = False
+    tasa_falsos_positivos: float = 0.01
+    error_relativo_hll: float = 0.01
+    tamano_bloque: int = 1_000_000
+
+
+class ConfigChequeosEntrada(Config):
+    """
+    Configuración de los chequeos de leer_datos en modo aproximado. Con medir_tiempo_exacto=True
+    también se corre el chequeo exacto sobre todo el DataFrame para medir el tiempo ahorrado y
+    el error de la aproximación (útil para calibrar, no en cada corrida: paga el costo exacto).
+    """
+    medir_tiempo_exacto: bool = False
 
 # ===============================================================================
 # PASO 2: LECTURA DE DATOS SIN TRANSFORMAR + CHEQUEOS DE ENTRADA  
@@ -22,20 +53,26 @@ PAISES_ANALISIS = ["Ecuador", "Peru"]
     description="Descarga datos crudos de COVID-19 desde Our World in Data",
     group_name="ingesta_datos"
 )
-def leer_datos(context: AssetExecutionContext) -> pd.DataFrame:
+def leer_datos(context: AssetExecutionContext, config: ConfigLecturaDatos) -> DataFrame:
     """
     Descarga el dataset completo de COVID-19 desde la URL canónica de OWID.
     
     Returns:
         DataFrame con todos los datos sin procesar
     """
+    import pandas as pd
+    import requests
     try:
         context.log.info(f"Descargando datos desde: {URL_DATOS_COVID}")
         response = requests.get(URL_DATOS_COVID, timeout=60)
         response.raise_for_status()
         
         # Cargar datos en DataFrame
-        df = pd.read_csv(io.StringIO(response.text))
+        if config.construir_sketches:
+            df = _leer_con_sketches(config, response.text)
+            context.log.info(f"Sketches de entrada construidos en {df.attrs[CLAVE_SKETCHES].tiempo_construccion_s:.2f} s")
+        else:
+            df = pd.read_csv(io.StringIO(response.text))
         
         context.log.info(f"Datos descargados exitosamente: {len(df)} filas, {len(df.columns)} columnas")
         context.log.info(f"Países únicos: {df['country'].nunique()}")
@@ -51,11 +88,31 @@ def leer_datos(context: AssetExecutionContext) -> pd.DataFrame:
         raise
 
 
+def _leer_con_sketches(config: ConfigLecturaDatos, texto: str) -> DataFrame:
+    """Lee el CSV por bloques construyendo los sketches de los chequeos de entrada"""
+    from proyecto_final.sketches import SketchesEntrada, leer_csv_por_bloques
+    
+    # Contar las líneas dimensiona el filtro de Bloom; es parte del costo de los sketches
+    inicio = time.perf_counter()
+    sketches = SketchesEntrada(
+        capacidad=texto.count("\n"),
+        columnas_unicidad=["country", "date"],
+        columnas_perfil=["country", "date", "population"],
+        columna_positiva="population",
+        tasa_falsos_positivos=config.tasa_falsos_positivos,
+        error_relativo_hll=config.error_relativo_hll,
+    )
+    sketches.tiempo_construccion_s += time.perf_counter() - inicio
+    df = leer_csv_por_bloques(io.StringIO(texto), sketches, config.tamano_bloque)
+    df.attrs[CLAVE_SKETCHES] = sketches
+    return df
+
+
 @asset(
     description="Genera tabla de perfilado básico de los datos",
     group_name="exploracion"
 )
-def tabla_perfilado(context: AssetExecutionContext, leer_datos: pd.DataFrame) -> pd.DataFrame:
+def tabla_perfilado(context: AssetExecutionContext, leer_datos: DataFrame) -> DataFrame:
     """
     Realiza perfilado básico de los datos descargados según especificaciones del proyecto.
     
@@ -65,6 +122,7 @@ def tabla_perfilado(context: AssetExecutionContext, leer_datos: pd.DataFrame) ->
     Returns:
         DataFrame con métricas de perfilado
     """
+    import pandas as pd
     context.log.info("Generando tabla de perfilado...")
     
     # Crear diccionario con métricas de perfilado
@@ -95,8 +153,9 @@ def tabla_perfilado(context: AssetExecutionContext, leer_datos: pd.DataFrame) ->
     return df_perfilado
 
 @asset_check(asset="leer_datos", description="Verificar que no hay fechas futuras")
-def check_no_fechas_futuras(leer_datos: pd.DataFrame) -> AssetCheckResult:
+def check_no_fechas_futuras(leer_datos: DataFrame) -> AssetCheckResult:
     """Valida que no existan fechas futuras en los datos"""
+    import pandas as pd
     fecha_max = pd.to_datetime(leer_datos["date"]).max()
     fecha_hoy = pd.Timestamp.now()
     
@@ -110,10 +169,13 @@ def check_no_fechas_futuras(leer_datos: pd.DataFrame) -> AssetCheckResult:
 
 
 @asset_check(asset="leer_datos", description="Verificar columnas clave no nulas")
-def check_columnas_clave_no_nulas(leer_datos: pd.DataFrame) -> AssetCheckResult:
+def check_columnas_clave_no_nulas(config: ConfigChequeosEntrada, leer_datos: DataFrame) -> AssetCheckResult:
     """Valida que las columnas clave no tengan valores nulos"""
     columnas_clave = ["country", "date", "population"]
     
+    if CLAVE_SKETCHES in leer_datos.attrs:
+        return _check_columnas_clave_aproximado(config, leer_datos, columnas_clave)
+    
     resultados = []
     for col in columnas_clave:
         if col in leer_datos.columns:
@@ -132,8 +194,11 @@ def check_columnas_clave_no_nulas(leer_datos: pd.DataFrame) -> AssetCheckResult:
 
 
 @asset_check(asset="leer_datos", description="Verificar unicidad de (country, date)")
-def check_unicidad_country_date(leer_datos: pd.DataFrame) -> AssetCheckResult:
+def check_unicidad_country_date(config: ConfigChequeosEntrada, leer_datos: DataFrame) -> AssetCheckResult:
     """Valida la unicidad de la combinación country-date"""
+    if CLAVE_SKETCHES in leer_datos.attrs:
+        return _check_unicidad_aproximado(config, leer_datos)
+    
     duplicados = leer_datos.duplicated(subset=["country", "date"]).sum()
     total_filas = len(leer_datos)
     
@@ -144,8 +209,11 @@ def check_unicidad_country_date(leer_datos: pd.DataFrame) -> AssetCheckResult:
 
 
 @asset_check(asset="leer_datos", description="Verificar que population > 0")
-def check_population_positiva(leer_datos: pd.DataFrame) -> AssetCheckResult:
+def check_population_positiva(config: ConfigChequeosEntrada, leer_datos: DataFrame) -> AssetCheckResult:
     """Valida que los valores de población sean positivos"""
+    if CLAVE_SKETCHES in leer_datos.attrs:
+        return _check_population_aproximado(config, leer_datos)
+    
     filas_poblacion_valida = (leer_datos["population"] > 0).sum()
     filas_poblacion_invalida = (leer_datos["population"] <= 0).sum()
     total_filas = len(leer_datos)
@@ -156,6 +224,132 @@ def check_population_positiva(leer_datos: pd.DataFrame) -> AssetCheckResult:
     )
 
 
+# Variantes aproximadas de los chequeos de entrada: leen los sketches que leer_datos
+# construyó por bloques (ConfigLecturaDatos.construir_sketches) en lugar del DataFrame
+
+def _metadata_tiempos(
+    config: ConfigChequeosEntrada,
+    leer_datos: DataFrame,
+    inicio: float,
+    resultado_aproximado: int,
+    chequeo_exacto
+) -> dict:
+    """Tiempos del chequeo aproximado; si se pide, mide el exacto y calcula ahorro y error"""
+    tiempo_chequeo = time.perf_counter() - inicio
+    tiempo_construccion = leer_datos.attrs[CLAVE_SKETCHES].tiempo_construccion_s
+    metadata = {
+        "tiempo_chequeo_s": round(tiempo_chequeo, 4),
+        "tiempo_construccion_sketches_s": round(tiempo_construccion, 4),
+    }
+    if config.medir_tiempo_exacto:
+        inicio_exacto = time.perf_counter()
+        resultado_exacto = int(chequeo_exacto(leer_datos))
+        tiempo_exacto = time.perf_counter() - inicio_exacto
+        metadata.update({
+            "tiempo_exacto_s": round(tiempo_exacto, 4),
+            # Se descuenta la construcción completa de los sketches en cada chequeo (cota pesimista)
+            "tiempo_ahorrado_s": round(tiempo_exacto - tiempo_chequeo - tiempo_construccion, 4),
+            "error_aproximacion": abs(resultado_aproximado - resultado_exacto),
+        })
+    return metadata
+
+
+def _check_columnas_clave_aproximado(
+    config: ConfigChequeosEntrada,
+    leer_datos: DataFrame,
+    columnas_clave: list
+) -> AssetCheckResult:
+    """Nulos tomados de los contadores por bloque (exactos y combinables entre fuentes)"""
+    inicio = time.perf_counter()
+    sketches = leer_datos.attrs[CLAVE_SKETCHES]
+    contadores = sketches.contadores
+    
+    resultados = [
+        f"{col}: {contadores[col].nulos}/{contadores[col].filas} nulos" if col in contadores
+        else f"{col}: COLUMNA NO EXISTE"
+        for col in columnas_clave
+    ]
+    
+    return AssetCheckResult(
+        passed=all(contadores[col].nulos == 0 for col in columnas_clave if col in contadores),
+        description=f"Validación columnas clave (aproximado): {'; '.join(resultados)}",
+        metadata={
+            "modo": "aproximado",
+            "contadores_exactos": True,
+            **_metadata_tiempos(
+                config,
+                leer_datos,
+                inicio,
+                sum(contador.nulos for contador in contadores.values()),
+                lambda df: sum(df[col].isna().sum() for col in contadores),
+            ),
+        }
+    )
+
+
+def _check_unicidad_aproximado(config: ConfigChequeosEntrada, leer_datos: DataFrame) -> AssetCheckResult:
+    """Filtro de Bloom + HyperLogLog; las claves marcadas ya se confirmaron de forma exacta al leer"""
+    inicio = time.perf_counter()
+    sketches = leer_datos.attrs[CLAVE_SKETCHES]
+    resultado = sketches.resumen_duplicados()
+    
+    return AssetCheckResult(
+        passed=resultado["duplicados"] == 0,
+        description=(
+            f"Duplicados encontrados: {resultado['duplicados']} de {len(leer_datos)} filas "
+            f"(revisadas exactamente: {resultado['filas_revisadas_exacto']})"
+        ),
+        metadata={
+            "modo": "aproximado",
+            **resultado,
+            **_metadata_tiempos(
+                config,
+                leer_datos,
+                inicio,
+                resultado["duplicados"],
+                lambda df: df.duplicated(subset=["country", "date"]).sum(),
+            ),
+        }
+    )
+
+
+def _check_population_aproximado(config: ConfigChequeosEntrada, leer_datos: DataFrame) -> AssetCheckResult:
+    """Nulos y mínimo por bloque; solo se recorren los bloques cuyo mínimo es <= 0"""
+    inicio = time.perf_counter()
+    sketches = leer_datos.attrs[CLAVE_SKETCHES]
+    contador = sketches.contadores["population"]
+    
+    filas_poblacion_invalida = 0
+    bloques_revisados = 0
+    for desde, hasta, minimo in sketches.minimos_por_bloque:
+        if minimo is not None and minimo <= 0:
+            filas_poblacion_invalida += int((leer_datos["population"].iloc[desde:hasta] <= 0).sum())
+            bloques_revisados += 1
+    filas_poblacion_valida = contador.filas - contador.nulos - filas_poblacion_invalida
+    
+    return AssetCheckResult(
+        passed=filas_poblacion_invalida == 0,
+        description=(
+            f"Población válida: {filas_poblacion_valida}/{contador.filas}, "
+            f"inválida: {filas_poblacion_invalida} (aproximado)"
+        ),
+        metadata={
+            "modo": "aproximado",
+            "contadores_exactos": True,
+            "poblacion_minima": float(contador.minimo) if contador.minimo is not None else float("nan"),
+            "bloques_revisados": bloques_revisados,
+            "bloques_totales": len(sketches.minimos_por_bloque),
+            **_metadata_tiempos(
+                config,
+                leer_datos,
+                inicio,
+                filas_poblacion_invalida,
+                lambda df: (df["population"] <= 0).sum(),
+            ),
+        }
+    )
+
+
 # ===============================================================================
 # PASO 3: PROCESAMIENTO DE DATOS
 # ===============================================================================
@@ -164,7 +358,7 @@ def check_population_positiva(leer_datos: pd.DataFrame) -> AssetCheckResult:
     description="Datos procesados y filtrados para análisis de Ecuador y Perú",
     group_name="procesamiento"
 )
-def datos_procesados(context: AssetExecutionContext, leer_datos: pd.DataFrame) -> pd.DataFrame:
+def datos_procesados(context: AssetExecutionContext, leer_datos: DataFrame) -> DataFrame:
     """
     Procesa y limpia los datos según especificaciones del proyecto.
     
@@ -174,9 +368,12 @@ def datos_procesados(context: AssetExecutionContext, leer_datos: pd.DataFrame) -
     Returns:
         DataFrame procesado listo para análisis
     """
+    import pandas as pd
     context.log.info("Iniciando procesamiento de datos...")
     
     df = leer_datos.copy()
+    # Los sketches solo sirven a los chequeos de leer_datos: no se propagan a los assets siguientes
+    df.attrs.pop(CLAVE_SKETCHES, None)
     filas_iniciales = len(df)
     
     # 1. Filtrar por países de interés
@@ -221,7 +418,7 @@ def datos_procesados(context: AssetExecutionContext, leer_datos: pd.DataFrame) -
     description="Métrica de incidencia acumulada a 7 días por 100mil habitantes",
     group_name="metricas"
 )
-def metrica_incidencia_7d(context: AssetExecutionContext, datos_procesados: pd.DataFrame) -> pd.DataFrame:
+def metrica_incidencia_7d(context: AssetExecutionContext, datos_procesados: DataFrame) -> DataFrame:
     """
     Calcula la incidencia acumulada a 7 días por 100,000 habitantes.
     
@@ -265,7 +462,7 @@ def metrica_incidencia_7d(context: AssetExecutionContext, datos_procesados: pd.D
     description="Métrica de factor de crecimiento semanal de casos",
     group_name="metricas"
 )
-def metrica_factor_crec_7d(context: AssetExecutionContext, datos_procesados: pd.DataFrame) -> pd.DataFrame:
+def metrica_factor_crec_7d(context: AssetExecutionContext, datos_procesados: DataFrame) -> DataFrame:
     """
     Calcula el factor de crecimiento semanal de casos.
     
@@ -324,7 +521,7 @@ def metrica_factor_crec_7d(context: AssetExecutionContext, datos_procesados: pd.
 # ===============================================================================
 
 @asset_check(asset="metrica_incidencia_7d", description="Validar rango de incidencia 7d")
-def check_incidencia_rango_valido(metrica_incidencia_7d: pd.DataFrame) -> AssetCheckResult:
+def check_incidencia_rango_valido(metrica_incidencia_7d: DataFrame) -> AssetCheckResult:
     """Valida que la incidencia esté en un rango razonable (0-2000)"""
     incidencia_valida = (
         (metrica_incidencia_7d["incidencia_7d"] >= 0) & 
@@ -341,7 +538,7 @@ def check_incidencia_rango_valido(metrica_incidencia_7d: pd.DataFrame) -> AssetC
 
 
 @asset_check(asset="metrica_factor_crec_7d", description="Validar factor de crecimiento")
-def check_factor_crecimiento_valido(metrica_factor_crec_7d: pd.DataFrame) -> AssetCheckResult:
+def check_factor_crecimiento_valido(metrica_factor_crec_7d: DataFrame) -> AssetCheckResult:
     """Valida que el factor de crecimiento sea positivo"""
     factores_positivos = (metrica_factor_crec_7d["factor_crec_7d"] > 0)
     
@@ -364,10 +561,10 @@ def check_factor_crecimiento_valido(metrica_factor_crec_7d: pd.DataFrame) -> Ass
 )
 def reporte_excel_covid(
     context: AssetExecutionContext,
-    datos_procesados: pd.DataFrame,
-    metrica_incidencia_7d: pd.DataFrame,
-    metrica_factor_crec_7d: pd.DataFrame,
-    tabla_perfilado: pd.DataFrame
+    datos_procesados: DataFrame,
+    metrica_incidencia_7d: DataFrame,
+    metrica_factor_crec_7d: DataFrame,
+    tabla_perfilado: DataFrame
 ) -> str:
     """
     Genera reporte final en Excel con todos los resultados del análisis.
@@ -381,6 +578,7 @@ def reporte_excel_covid(
     Returns:
         Ruta del archivo Excel generado
     """
+    import pandas as pd
     context.log.info("Generando reporte final en Excel...")
     
     archivo_excel = "reporte_covid_ecuador_peru.xlsx"
@@ -429,11 +627,12 @@ def reporte_excel_covid(
 
 
 def crear_resumen_analisis(
-    datos_procesados: pd.DataFrame,
-    metrica_incidencia_7d: pd.DataFrame,
-    metrica_factor_crec_7d: pd.DataFrame
-) -> pd.DataFrame:
+    datos_procesados: DataFrame,
+    metrica_incidencia_7d: DataFrame,
+    metrica_factor_crec_7d: DataFrame
+) -> DataFrame:
     """Crea un resumen estadístico del análisis realizado"""
+    import pandas as pd
     
     resumen_data = []
     
@@ -0,0 +1,281 @@
+"""
+Sketches combinables (mergeables) para chequeos aproximados sobre datos muy grandes.
+
+Cada estructura se alimenta por bloques y se puede combinar con otra del mismo tipo, de modo
+que varias fuentes o años se procesan por separado y luego se unen. SketchesEntrada las
+construye mientras leer_datos lee el CSV. Este módulo importa numpy y pandas, por eso
+leer_datos lo importa dentro de su cuerpo y no al cargar las definiciones.
+"""
+
+import math
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+_MASCARA_32 = np.uint64(0xFFFFFFFF)
+_MULTIPLICADOR_MEZCLA = np.uint64(0x94D049BB133111EB)
+
+
+def hash_filas(df: pd.DataFrame, columnas: List[str]) -> np.ndarray:
+    """Hash de 64 bits por fila de las columnas indicadas (vectorizado)."""
+    # Las columnas de texto se hashean como categorías: cada valor distinto una sola vez.
+    # pandas garantiza que el hash de una categórica coincide con el de sus valores.
+    claves = pd.DataFrame({
+        col: df[col] if pd.api.types.is_numeric_dtype(df[col]) else df[col].astype("category")
+        for col in columnas
+    })
+    return pd.util.hash_pandas_object(claves, index=False).to_numpy(dtype=np.uint64)
+
+
+def _longitud_bits(valores: np.ndarray) -> np.ndarray:
+    """Equivalente vectorizado de int.bit_length para uint64 (exacto, sin redondeo de float)."""
+    altos = (valores >> np.uint64(32)).astype(np.float64)
+    bajos = (valores & _MASCARA_32).astype(np.float64)
+    return np.where(altos > 0, np.frexp(altos)[1] + 32, np.frexp(bajos)[1])
+
+
+class HyperLogLog:
+    """Estimador de cardinalidad con error relativo ~1.04 / sqrt(2^precision)."""
+
+    def __init__(self, error_relativo: float = 0.01):
+        self.precision = min(18, max(4, math.ceil(math.log2((1.04 / error_relativo) ** 2))))
+        self.registros = np.zeros(1 << self.precision, dtype=np.uint8)
+
+    @property
+    def error_estandar(self) -> float:
+        return 1.04 / math.sqrt(len(self.registros))
+
+    def agregar(self, hashes: np.ndarray) -> None:
+        bits_restantes = 64 - self.precision
+        indices = (hashes >> np.uint64(bits_restantes)).astype(np.int64)
+        resto = hashes & np.uint64((1 << bits_restantes) - 1)
+        rangos = (bits_restantes - _longitud_bits(resto) + 1).astype(np.uint8)
+        np.maximum.at(self.registros, indices, rangos)
+
+    def combinar(self, otro: "HyperLogLog") -> "HyperLogLog":
+        if otro.precision != self.precision:
+            raise ValueError("Solo se pueden combinar HyperLogLog con la misma precisión")
+        np.maximum(self.registros, otro.registros, out=self.registros)
+        return self
+
+    def estimar(self) -> float:
+        m = len(self.registros)
+        alfa = 0.7213 / (1 + 1.079 / m)
+        estimacion = alfa * m * m / np.sum(np.ldexp(1.0, -self.registros.astype(np.int64)))
+        ceros = int(np.count_nonzero(self.registros == 0))
+        if estimacion <= 2.5 * m and ceros:
+            # Corrección para cardinalidades pequeñas (conteo lineal)
+            estimacion = m * math.log(m / ceros)
+        return float(estimacion)
+
+
+def _tasa_filtro_por_palabras(claves_por_palabra: float, n_hashes: int) -> float:
+    """
+    Falsos positivos esperados cuando cada palabra de 64 bits recibe Poisson(carga) claves.
+
+    Los n_hashes bits de una clave se eligen con reemplazo y pueden repetirse, así que se
+    promedia sobre el número de bits distintos de la consulta (inclusión-exclusión).
+    """
+    distintos = [1.0]  # distintos[d]: probabilidad de que la consulta marque d bits distintos
+    for _ in range(n_hashes):
+        siguiente = [0.0] * (len(distintos) + 1)
+        for d, p in enumerate(distintos):
+            siguiente[d] += p * d / 64
+            siguiente[d + 1] += p * (64 - d) / 64
+        distintos = siguiente
+
+    probabilidad = math.exp(-claves_por_palabra)
+    tasa = 0.0
+    for claves in range(int(claves_por_palabra + 10 * math.sqrt(claves_por_palabra) + 20)):
+        if claves:
+            probabilidad *= claves_por_palabra / claves
+        elecciones = n_hashes * claves
+        todos_marcados = sum(
+            p * sum((-1) ** t * math.comb(d, t) * (1 - t / 64) ** elecciones for t in range(d + 1))
+            for d, p in enumerate(distintos)
+        )
+        tasa += probabilidad * todos_marcados
+    return tasa
+
+
+class FiltroBloom:
+    """
+    Filtro de Bloom por palabras sobre hashes de 64 bits, dimensionado para una tasa de falsos positivos.
+
+    Cada clave cae en una sola palabra de 64 bits y marca ahí sus n_hashes bits: consultar e
+    insertar es una lectura y un bitwise_or.at por fila, en lugar de n_hashes accesos aleatorios.
+    Concentrar los bits en una palabra sube la tasa, por eso el número de palabras se calcula con
+    la tasa del filtro por palabras y no con la fórmula del filtro clásico.
+    """
+
+    def __init__(self, capacidad: int, tasa_falsos_positivos: float = 0.01):
+        capacidad = max(1, capacidad)
+        self.tasa_falsos_positivos = tasa_falsos_positivos
+        self.n_hashes = max(1, round(-math.log2(tasa_falsos_positivos)))
+        n_palabras = max(1, math.ceil(-capacidad * math.log(tasa_falsos_positivos) / math.log(2) ** 2 / 64))
+        while _tasa_filtro_por_palabras(capacidad / n_palabras, self.n_hashes) > tasa_falsos_positivos:
+            n_palabras = math.ceil(n_palabras * 1.05)
+        self.palabras = np.zeros(n_palabras, dtype=np.uint64)
+
+    def _ubicar(self, hashes: np.ndarray):
+        # La mitad baja del hash elige la palabra; cada bit sale de 6 bits de una mezcla del hash
+        # (splitmix64), que se vuelve a mezclar cada 10 bits usados.
+        indices = ((hashes & _MASCARA_32) % np.uint64(len(self.palabras))).astype(np.int64)
+        mascaras = np.zeros(len(hashes), dtype=np.uint64)
+        mezcla = hashes
+        for i in range(self.n_hashes):
+            if i % 10 == 0:
+                mezcla = (mezcla ^ (mezcla >> np.uint64(31))) * _MULTIPLICADOR_MEZCLA
+            mascaras |= np.uint64(1) << ((mezcla >> np.uint64(58 - 6 * (i % 10))) & np.uint64(63))
+        return indices, mascaras
+
+    def agregar_y_consultar(self, hashes: np.ndarray) -> np.ndarray:
+        """Inserta los hashes y devuelve cuáles ya estaban (posiblemente) en el filtro."""
+        indices, mascaras = self._ubicar(hashes)
+        presentes = (self.palabras[indices] & mascaras) == mascaras
+        np.bitwise_or.at(self.palabras, indices, mascaras)
+        return presentes
+
+    def combinar(self, otro: "FiltroBloom") -> "FiltroBloom":
+        if (len(otro.palabras), otro.n_hashes) != (len(self.palabras), self.n_hashes):
+            raise ValueError("Solo se pueden combinar filtros con el mismo tamaño y número de hashes")
+        np.bitwise_or(self.palabras, otro.palabras, out=self.palabras)
+        return self
+
+
+class ContadorColumna:
+    """Contadores exactos en streaming: filas, nulos y, en columnas numéricas, mínimo y máximo."""
+
+    def __init__(self):
+        self.filas = 0
+        self.nulos = 0
+        self.minimo = None
+        self.maximo = None
+
+    def agregar(self, valores: pd.Series) -> None:
+        self.filas += len(valores)
+        self.nulos += int(valores.isna().sum())
+        if not pd.api.types.is_numeric_dtype(valores):
+            return
+        for extremo, actual, elegir in (("minimo", valores.min(), min), ("maximo", valores.max(), max)):
+            if pd.notna(actual):
+                previo = getattr(self, extremo)
+                setattr(self, extremo, actual if previo is None else elegir(previo, actual))
+
+    def combinar(self, otro: "ContadorColumna") -> "ContadorColumna":
+        self.filas += otro.filas
+        self.nulos += otro.nulos
+        for extremo, elegir in (("minimo", min), ("maximo", max)):
+            valores = [v for v in (getattr(self, extremo), getattr(otro, extremo)) if v is not None]
+            setattr(self, extremo, elegir(valores) if valores else None)
+        return self
+
+
+class SketchesEntrada:
+    """
+    Sketches de los chequeos de leer_datos, construidos bloque a bloque mientras se lee el CSV.
+
+    Por cada bloque se calcula el hash de la clave de unicidad (filtro de Bloom y HyperLogLog),
+    los contadores de las columnas perfiladas y el mínimo de la columna que debe ser positiva.
+    Al cerrar, los duplicados se confirman de forma exacta solo entre las filas cuya clave
+    marcó el filtro, así los chequeos leen resultados ya calculados y no recorren el DataFrame.
+    """
+
+    def __init__(
+        self,
+        capacidad: int,
+        columnas_unicidad: List[str],
+        columnas_perfil: List[str],
+        columna_positiva: str,
+        tasa_falsos_positivos: float = 0.01,
+        error_relativo_hll: float = 0.01,
+    ):
+        self.columnas_unicidad = columnas_unicidad
+        self.columnas_perfil = columnas_perfil
+        self.columna_positiva = columna_positiva
+        self.bloom = FiltroBloom(capacidad, tasa_falsos_positivos)
+        self.hll = HyperLogLog(error_relativo_hll)
+        self.contadores: Dict[str, ContadorColumna] = {}
+        # (desde, hasta, mínimo) por bloque: solo se revisan los bloques con mínimo <= 0
+        self.minimos_por_bloque: List[Tuple[int, int, Optional[float]]] = []
+        self.filas = 0
+        self.filas_marcadas = 0
+        self.duplicados: Optional[int] = None
+        self.filas_revisadas_exacto = 0
+        self.tiempo_construccion_s = 0.0
+        self._hashes_por_bloque: List[np.ndarray] = []
+        self._hashes_marcados: List[np.ndarray] = []
+
+    def agregar(self, bloque: pd.DataFrame) -> None:
+        inicio = time.perf_counter()
+        desde, hasta = self.filas, self.filas + len(bloque)
+        if not self.contadores:
+            self.contadores = {col: ContadorColumna() for col in self.columnas_perfil if col in bloque.columns}
+
+        hashes = hash_filas(bloque, self.columnas_unicidad)
+        # Repeticiones dentro del mismo bloque: el filtro todavía no las contiene
+        repetidas = pd.Series(hashes).duplicated().to_numpy()
+        marcadas = self.bloom.agregar_y_consultar(hashes) | repetidas
+        self.hll.agregar(hashes)
+        self._hashes_por_bloque.append(hashes)
+        self._hashes_marcados.append(hashes[marcadas])
+        self.filas_marcadas += int(marcadas.sum())
+
+        for col, contador in self.contadores.items():
+            contador.agregar(bloque[col])
+        if self.columna_positiva in bloque.columns:
+            minimo = bloque[self.columna_positiva].min()
+            self.minimos_por_bloque.append((desde, hasta, None if pd.isna(minimo) else float(minimo)))
+
+        self.filas = hasta
+        self.tiempo_construccion_s += time.perf_counter() - inicio
+
+    def cerrar(self, df: pd.DataFrame) -> "SketchesEntrada":
+        """Confirma los duplicados entre las filas marcadas y libera los hashes por fila."""
+        inicio = time.perf_counter()
+        marcados = np.concatenate(self._hashes_marcados) if self._hashes_marcados else np.empty(0, np.uint64)
+        if len(marcados):
+            # El filtro no tiene falsos negativos: toda fila repetida está entre las candidatas
+            candidatas = np.concatenate([pd.Series(h).isin(marcados).to_numpy() for h in self._hashes_por_bloque])
+            self.filas_revisadas_exacto = int(candidatas.sum())
+            self.duplicados = int(df.loc[candidatas, self.columnas_unicidad].duplicated().sum())
+        else:
+            self.duplicados = 0
+        self._hashes_por_bloque, self._hashes_marcados = [], []
+        self.tiempo_construccion_s += time.perf_counter() - inicio
+        return self
+
+    def resumen_duplicados(self) -> Dict:
+        return {
+            "duplicados": self.duplicados,
+            "filas_marcadas": self.filas_marcadas,
+            "filas_revisadas_exacto": self.filas_revisadas_exacto,
+            "falsos_positivos": self.filas_marcadas - self.duplicados,
+            "tasa_falsos_positivos_configurada": self.bloom.tasa_falsos_positivos,
+            "claves_distintas_estimadas": round(self.hll.estimar()),
+            "error_relativo_hll": round(self.hll.error_estandar, 5),
+        }
+
+    def __deepcopy__(self, memo) -> "SketchesEntrada":
+        # pandas copia DataFrame.attrs con deepcopy en cada operación; cerrados no cambian
+        return self
+
+
+def leer_csv_por_bloques(fuente, sketches: SketchesEntrada, tamano_bloque: int = 1_000_000) -> pd.DataFrame:
+    """
+    Lee un CSV con chunksize alimentando los sketches con cada bloque y los cierra al final.
+
+    Las columnas de la clave de unicidad se leen como texto: pandas deduce el tipo de cada
+    bloque por separado, y la misma clave leída como 1 en un bloque y 1.0 en otro (o una
+    columna toda nula) tendría hashes distintos y el filtro no marcaría la repetición.
+    """
+    bloques = []
+    tipos_clave = {col: str for col in sketches.columnas_unicidad}
+    for bloque in pd.read_csv(fuente, chunksize=tamano_bloque, dtype=tipos_clave):
+        sketches.agregar(bloque)
+        bloques.append(bloque)
+    df = pd.concat(bloques, ignore_index=True) if len(bloques) != 1 else bloques[0]
+    sketches.cerrar(df)
+    return df
@@ -0,0 +1,66 @@
+"""
+Benchmark y presupuesto de arranque de la code location: tiempo de importación en frío de
+proyecto_final.definitions y tiempo de carga de las definiciones (load_from_defs_folder).
+Cada medición se hace en un intérprete nuevo para que sea realmente en frío.
+
+Benchmark: python tests/test_arranque.py
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+RAIZ_PROYECTO = Path(__file__).parent.parent
+
+PRESUPUESTO_IMPORTACION_S = 2.0
+PRESUPUESTO_CARGA_DEFS_S = 0.5
+LIBRERIAS_PESADAS = ["pandas", "requests", "numpy", "openpyxl"]
+
+_SCRIPT_MEDICION = """
+import json, sys, time
+inicio = time.perf_counter()
+import proyecto_final.definitions as definitions
+importacion = time.perf_counter() - inicio
+inicio = time.perf_counter()
+definitions.defs()
+carga = time.perf_counter() - inicio
+print(json.dumps({
+    "importacion_s": importacion,
+    "carga_defs_s": carga,
+    "pesadas_cargadas": [m for m in %r if m in sys.modules],
+}))
+""" % (LIBRERIAS_PESADAS,)
+
+
+def medir_arranque() -> dict:
+    entorno = dict(os.environ)
+    entorno["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [str(RAIZ_PROYECTO / "src"), entorno.get("PYTHONPATH")])
+    )
+    salida = subprocess.run(
+        [sys.executable, "-c", _SCRIPT_MEDICION],
+        capture_output=True, text=True, check=True, env=entorno, cwd=RAIZ_PROYECTO,
+    )
+    return json.loads(salida.stdout.strip().splitlines()[-1])
+
+
+def test_definiciones_no_importan_librerias_pesadas():
+    assert medir_arranque()["pesadas_cargadas"] == []
+
+
+def test_presupuesto_de_arranque():
+    # Se toma el mejor de tres para no depender de ruido puntual de la máquina.
+    mediciones = [medir_arranque() for _ in range(3)]
+    importacion = min(m["importacion_s"] for m in mediciones)
+    carga = min(m["carga_defs_s"] for m in mediciones)
+    assert importacion < PRESUPUESTO_IMPORTACION_S, f"Importación en frío: {importacion:.2f} s"
+    assert carga < PRESUPUESTO_CARGA_DEFS_S, f"Carga de definiciones: {carga:.2f} s"
+
+
+if __name__ == "__main__":
+    for _ in range(5):
+        m = medir_arranque()
+        print(f"importación: {m['importacion_s']:.3f} s  carga defs: {m['carga_defs_s']:.3f} s  "
+              f"librerías pesadas: {m['pesadas_cargadas']}")
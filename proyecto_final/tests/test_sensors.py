@@ -0,0 +1,149 @@
+"""Pruebas del sensor de cambios de OWID contra un servidor HTTP local que hace de fuente."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from dagster import RunRequest, SkipReason, build_sensor_context
+
+from proyecto_final.defs.sensors import (
+    FuenteSinHuella,
+    crear_sensor_cambios,
+    evaluar_cambio,
+    sondear_fuente,
+)
+
+
+class _Fuente:
+    contenido = b"country,date\nEcuador,2024-01-01\n"
+    etag = None
+    ignora_rango = False
+    sin_longitud = False
+    peticiones = []
+
+
+class _Manejador(BaseHTTPRequestHandler):
+    def _cabeceras(self, cuerpo, estado=200, rango_contenido=None):
+        self.send_response(estado)
+        if not _Fuente.sin_longitud:
+            self.send_header("Content-Length", str(len(cuerpo)))
+        if rango_contenido:
+            self.send_header("Content-Range", rango_contenido)
+        if _Fuente.etag:
+            self.send_header("ETag", _Fuente.etag)
+        self.end_headers()
+
+    def do_HEAD(self):
+        _Fuente.peticiones.append(("HEAD", None))
+        self._cabeceras(_Fuente.contenido)
+
+    def do_GET(self):
+        rango = self.headers.get("Range")
+        _Fuente.peticiones.append(("GET", rango))
+        cuerpo = _Fuente.contenido
+        if rango and rango.startswith("bytes=-") and not _Fuente.ignora_rango:
+            total = len(cuerpo)
+            cuerpo = cuerpo[-int(rango[len("bytes=-"):]):]
+            self._cabeceras(cuerpo, 206, f"bytes {total - len(cuerpo)}-{total - 1}/{total}")
+        else:
+            self._cabeceras(cuerpo)
+        self.wfile.write(cuerpo)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def url_fuente():
+    _Fuente.contenido = b"country,date\nEcuador,2024-01-01\n"
+    _Fuente.etag = None
+    _Fuente.ignora_rango = False
+    _Fuente.sin_longitud = False
+    _Fuente.peticiones = []
+    servidor = ThreadingHTTPServer(("127.0.0.1", 0), _Manejador)
+    hilo = threading.Thread(target=servidor.serve_forever, daemon=True)
+    hilo.start()
+    yield f"http://127.0.0.1:{servidor.server_port}/compact.csv"
+    servidor.shutdown()
+    servidor.server_close()
+
+
+def test_sondeo_usa_validadores_sin_descargar(url_fuente):
+    _Fuente.etag = '"v1"'
+    huella = sondear_fuente(url_fuente)
+    assert _Fuente.peticiones == [("HEAD", None)]
+    _Fuente.etag = '"v2"'
+    assert sondear_fuente(url_fuente) != huella
+
+
+def test_sondeo_sin_validadores_hashea_sufijo(url_fuente):
+    huella = sondear_fuente(url_fuente, bytes_muestra=8)
+    assert ("GET", "bytes=-8") in _Fuente.peticiones
+    assert sondear_fuente(url_fuente, bytes_muestra=8) == huella
+    _Fuente.contenido += b"Peru,2024-01-02\n"
+    assert sondear_fuente(url_fuente, bytes_muestra=8) != huella
+
+
+def test_sondeo_sin_rango_usa_el_tamano(url_fuente):
+    _Fuente.ignora_rango = True
+    huella = sondear_fuente(url_fuente, bytes_muestra=8)
+    _Fuente.contenido += b"Peru,2024-01-02\n"
+    assert sondear_fuente(url_fuente, bytes_muestra=8) != huella
+
+
+def test_sondeo_sin_rango_ni_longitud_falla(url_fuente):
+    _Fuente.ignora_rango = True
+    _Fuente.sin_longitud = True
+    with pytest.raises(FuenteSinHuella):
+        sondear_fuente(url_fuente)
+    sensor_prueba = crear_sensor_cambios(url=url_fuente, nombre="sensor_sin_huella", espera_s=0)
+    assert isinstance(sensor_prueba(build_sensor_context()), SkipReason)
+
+
+def test_evaluar_cambio_con_debounce():
+    lanzar, estado = evaluar_cambio(None, "a", ahora=0, espera_s=60)
+    assert not lanzar and estado["pendiente"] == "a"
+    lanzar, estado = evaluar_cambio(json.dumps(estado), "b", ahora=30, espera_s=60)
+    assert not lanzar and estado["pendiente_desde"] == 30
+    lanzar, estado = evaluar_cambio(json.dumps(estado), "b", ahora=90, espera_s=60)
+    assert lanzar and estado["huella"] == "b"
+    lanzar, _ = evaluar_cambio(json.dumps(estado), "b", ahora=1000, espera_s=60)
+    assert not lanzar
+
+
+def test_sensor_lanza_solo_cuando_cambia_la_fuente(url_fuente):
+    sensor_prueba = crear_sensor_cambios(url=url_fuente, nombre="sensor_prueba", espera_s=0)
+
+    contexto = build_sensor_context()
+    assert isinstance(sensor_prueba(contexto), RunRequest)
+
+    # El cursor persistido es lo único que sobrevive a un reinicio del daemon
+    contexto = build_sensor_context(cursor=contexto.cursor)
+    assert isinstance(sensor_prueba(contexto), SkipReason)
+
+    _Fuente.contenido += b"Peru,2024-01-02\n"
+    contexto = build_sensor_context(cursor=contexto.cursor)
+    assert isinstance(sensor_prueba(contexto), RunRequest)
+
+
+def test_sensor_relanza_si_la_fuente_vuelve_a_una_version_anterior(url_fuente):
+    sensor_prueba = crear_sensor_cambios(url=url_fuente, nombre="sensor_aba", espera_s=0)
+    original = _Fuente.contenido
+    claves = []
+    cursor = None
+    for contenido in (original, original + b"Peru,2024-01-02\n", original):
+        _Fuente.contenido = contenido
+        contexto = build_sensor_context(cursor=cursor)
+        resultado = sensor_prueba(contexto)
+        assert isinstance(resultado, RunRequest)
+        claves.append(resultado.run_key)
+        cursor = contexto.cursor
+    assert len(set(claves)) == 3
+
+
+def test_sensor_omite_si_la_fuente_no_responde():
+    sensor_prueba = crear_sensor_cambios(url="http://127.0.0.1:9/no-existe", nombre="sensor_caido")
+    contexto = build_sensor_context(cursor='{"huella": "x"}')
+    assert isinstance(sensor_prueba(contexto), SkipReason)
+    assert contexto.cursor == '{"huella": "x"}'
@@ -0,0 +1,137 @@
+"""Pruebas de los sketches y de los chequeos de leer_datos en modo aproximado."""
+
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+from proyecto_final.defs.assets import (
+    CLAVE_SKETCHES,
+    ConfigChequeosEntrada,
+    ConfigLecturaDatos,
+    _leer_con_sketches,
+    check_columnas_clave_no_nulas,
+    check_population_positiva,
+    check_unicidad_country_date,
+)
+from proyecto_final.sketches import ContadorColumna, FiltroBloom, HyperLogLog, hash_filas
+
+
+def _hashes(valores):
+    return hash_filas(pd.DataFrame({"clave": valores}), ["clave"])
+
+
+@pytest.fixture
+def datos_crudos():
+    rng = np.random.default_rng(0)
+    n = 50_000
+    df = pd.DataFrame({
+        "country": rng.choice(["Ecuador", "Peru", "Chile", "Colombia"], n),
+        "date": pd.Series(rng.integers(0, 20_000, n)).astype(str),
+        "population": rng.uniform(1e5, 1e8, n),
+    })
+    df.loc[10_000:10_050, "population"] = 0
+    df.loc[::1_301, "country"] = None
+    return df
+
+
+@pytest.fixture
+def datos_con_sketches(datos_crudos):
+    config = ConfigLecturaDatos(construir_sketches=True, tamano_bloque=7_000)
+    return _leer_con_sketches(config, datos_crudos.to_csv(index=False))
+
+
+@pytest.mark.parametrize("cardinalidad", [0, 100, 10_000, 200_000])
+def test_hyperloglog_respeta_el_error_configurado(cardinalidad):
+    hll = HyperLogLog(error_relativo=0.02)
+    hll.agregar(_hashes(np.arange(cardinalidad)))
+    assert abs(hll.estimar() - cardinalidad) <= 4 * hll.error_estandar * max(cardinalidad, 1)
+
+
+def test_hyperloglog_combinado_equivale_a_la_union():
+    a, b = HyperLogLog(), HyperLogLog()
+    a.agregar(_hashes(np.arange(0, 60_000)))
+    b.agregar(_hashes(np.arange(40_000, 100_000)))
+    assert abs(a.combinar(b).estimar() - 100_000) <= 4 * a.error_estandar * 100_000
+
+
+def test_bloom_sin_falsos_negativos_y_tasa_acotada():
+    bloom = FiltroBloom(capacidad=20_000, tasa_falsos_positivos=0.01)
+    bloom.agregar_y_consultar(_hashes(np.arange(20_000)))
+    assert bloom.agregar_y_consultar(_hashes(np.arange(20_000))).all()
+    falsos_positivos = bloom.agregar_y_consultar(_hashes(np.arange(100_000, 120_000))).mean()
+    assert falsos_positivos < 0.02
+
+
+def test_contadores_combinables():
+    izquierda, derecha = ContadorColumna(), ContadorColumna()
+    izquierda.agregar(pd.Series([3.0, None, 7.0]))
+    derecha.agregar(pd.Series([-1.0, 2.0]))
+    total = izquierda.combinar(derecha)
+    assert (total.filas, total.nulos, total.minimo, total.maximo) == (5, 1, -1.0, 7.0)
+
+
+def test_sketches_de_lectura_confirman_los_duplicados_exactos(datos_con_sketches):
+    sketches = datos_con_sketches.attrs[CLAVE_SKETCHES]
+    resumen = sketches.resumen_duplicados()
+    assert resumen["duplicados"] == datos_con_sketches.duplicated(subset=["country", "date"]).sum()
+    assert resumen["falsos_positivos"] >= 0
+    assert resumen["filas_revisadas_exacto"] < len(datos_con_sketches)
+    assert sketches.filas == len(datos_con_sketches)
+
+
+def test_sketches_sobreviven_al_pickle_del_io_manager(datos_con_sketches):
+    original = datos_con_sketches.attrs[CLAVE_SKETCHES]
+    restaurado = pickle.loads(pickle.dumps(datos_con_sketches)).attrs[CLAVE_SKETCHES]
+    assert np.array_equal(restaurado.bloom.palabras, original.bloom.palabras)
+    assert restaurado.resumen_duplicados() == original.resumen_duplicados()
+
+
+@pytest.mark.parametrize(
+    "chequeo",
+    [check_unicidad_country_date, check_population_positiva, check_columnas_clave_no_nulas],
+)
+def test_modo_aproximado_da_el_mismo_resultado(chequeo, datos_crudos, datos_con_sketches):
+    exacto = chequeo(ConfigChequeosEntrada(), datos_crudos)
+    aproximado = chequeo(ConfigChequeosEntrada(), datos_con_sketches)
+    assert aproximado.passed == exacto.passed
+    assert aproximado.description.replace(" (aproximado)", "").split(" (")[0] == exacto.description
+    assert aproximado.metadata["modo"].value == "aproximado"
+
+
+def test_population_aproximado_solo_revisa_bloques_con_minimo_no_positivo(datos_con_sketches):
+    metadata = check_population_positiva(ConfigChequeosEntrada(), datos_con_sketches).metadata
+    # Los ceros están en las filas 10_000 a 10_050: un solo bloque de 7_000 filas
+    assert (metadata["bloques_revisados"].value, metadata["bloques_totales"].value) == (1, 8)
+
+
+@pytest.mark.parametrize(
+    "texto",
+    [
+        # date se deduce int64 en el primer bloque y float64 (por el nulo) en el segundo
+        "country,date,population\nA,1,1\nB,,1\nA,1,1\nA,2,1\n",
+        # country queda toda nula (float64) en el primer bloque y como texto en el segundo
+        "country,date,population\n,1,1\n,2,1\n,1,1\nA,3,1\n",
+    ],
+)
+def test_duplicados_exactos_aunque_el_tipo_de_la_clave_cambie_entre_bloques(texto):
+    datos = _leer_con_sketches(ConfigLecturaDatos(construir_sketches=True, tamano_bloque=2), texto)
+    assert datos.attrs[CLAVE_SKETCHES].resumen_duplicados()["duplicados"] == 1
+    assert not check_unicidad_country_date(ConfigChequeosEntrada(), datos).passed
+
+
+@pytest.mark.parametrize(
+    "chequeo",
+    [check_unicidad_country_date, check_population_positiva, check_columnas_clave_no_nulas],
+)
+def test_medir_tiempo_exacto_reporta_ahorro_y_error(chequeo, datos_con_sketches):
+    sin_medir = chequeo(ConfigChequeosEntrada(), datos_con_sketches).metadata
+    assert "tiempo_ahorrado_s" not in sin_medir
+    medido = chequeo(ConfigChequeosEntrada(medir_tiempo_exacto=True), datos_con_sketches).metadata
+    assert medido["error_aproximacion"].value == 0
+    assert medido["tiempo_ahorrado_s"].value == pytest.approx(
+        medido["tiempo_exacto_s"].value
+        - medido["tiempo_chequeo_s"].value
+        - medido["tiempo_construccion_sketches_s"].value,
+        abs=1e-3,
+    )